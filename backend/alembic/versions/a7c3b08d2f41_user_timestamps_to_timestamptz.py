@@ -0,0 +1,46 @@
+"""User timestamps to timestamptz
+
+Revision ID: a7c3b08d2f41
+Revises: c41d2a9f5e08
+Create Date: 2026-08-27 14:02:47.193625
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3b08d2f41'
+down_revision: Union[str, None] = 'c41d2a9f5e08'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # asyncpg refuse les datetimes aware sur TIMESTAMP WITHOUT TIME ZONE ;
+    # les valeurs existantes ont toujours été stockées en UTC.
+    op.alter_column(
+        'user', 'created_at',
+        type_=sa.DateTime(timezone=True),
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        'user', 'updated_at',
+        type_=sa.DateTime(timezone=True),
+        postgresql_using="updated_at AT TIME ZONE 'UTC'",
+    )
+
+
+def downgrade() -> None:
+    op.alter_column(
+        'user', 'updated_at',
+        type_=sa.DateTime(),
+        postgresql_using="updated_at AT TIME ZONE 'UTC'",
+    )
+    op.alter_column(
+        'user', 'created_at',
+        type_=sa.DateTime(),
+        postgresql_using="created_at AT TIME ZONE 'UTC'",
+    )
@@ -0,0 +1,47 @@
+"""User hot path indexes
+
+Revision ID: c41d2a9f5e08
+Revises: 7f064ca1b16a
+Create Date: 2026-08-27 09:41:12.508214
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d2a9f5e08'
+down_revision: Union[str, None] = '7f064ca1b16a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Refuse to build the unique index over existing duplicate emails:
+    # fail with an actionable message instead of a raw IntegrityError.
+    duplicates = op.get_bind().execute(sa.text(
+        'SELECT email FROM "user" GROUP BY email HAVING count(*) > 1'
+    )).scalars().all()
+    if duplicates:
+        raise RuntimeError(
+            "Duplicate emails must be resolved before ix_user_email can "
+            f"become unique: {', '.join(duplicates)}"
+        )
+
+    # Unique index backs the EXISTS conflict check on registration
+    op.drop_index(op.f('ix_user_email'), table_name='user')
+    op.create_index(op.f('ix_user_email'), 'user', ['email'], unique=True)
+    # Covering index serves the authenticated username lookup index-only
+    op.create_index(
+        'ix_user_username_covering', 'user', ['username'],
+        unique=False,
+        postgresql_include=['hashed_password', 'is_active', 'role'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_user_username_covering', table_name='user')
+    op.drop_index(op.f('ix_user_email'), table_name='user')
+    op.create_index(op.f('ix_user_email'), 'user', ['email'], unique=False)
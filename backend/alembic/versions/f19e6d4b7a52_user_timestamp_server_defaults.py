@@ -0,0 +1,28 @@
+"""User timestamp server defaults
+
+Revision ID: f19e6d4b7a52
+Revises: a7c3b08d2f41
+Create Date: 2026-08-27 14:21:05.847310
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f19e6d4b7a52'
+down_revision: Union[str, None] = 'a7c3b08d2f41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.alter_column('user', 'created_at', server_default=sa.text('now()'))
+    op.alter_column('user', 'updated_at', server_default=sa.text('now()'))
+
+
+def downgrade() -> None:
+    op.alter_column('user', 'updated_at', server_default=None)
+    op.alter_column('user', 'created_at', server_default=None)
@@ -1,26 +1,16 @@
 import os
 from urllib.parse import quote_plus
 
-from datetime import datetime, timezone
-from typing import Annotated
+from typing import Annotated, AsyncGenerator
 
 from dotenv import load_dotenv
 from fastapi import Depends
-from sqlmodel import Session, create_engine
-from sqlalchemy import event
-
-from app.models.user_models import User
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 load_dotenv()
 
 
-# Hook pour mettre à jour `updated_at`
-def update_timestamp(session, flush_context, instances):
-    for instance in session.dirty:
-        if hasattr(instance, "updated_at"):
-            instance.updated_at = datetime.now(timezone.utc)
-
-
 # Configuration de la base de données
 DB_USER = os.getenv("DB_USER")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
@@ -31,18 +21,28 @@ DB_NAME = os.getenv("DB_NAME")
 # URL-encode the password
 encoded_password = quote_plus(DB_PASSWORD)
 
-DATABASE_URL = f"postgresql://{DB_USER}:{encoded_password}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
-engine = create_engine(DATABASE_URL)
+DATABASE_URL = f"postgresql+asyncpg://{DB_USER}:{encoded_password}@{DB_HOST}:{DB_PORT}/{DB_NAME}"
+
+# Pool de connexions dimensionné (les défauts pool_size=5/overflow=10 saturent
+# sous charge) ; pool_pre_ping écarte les connexions mortes sans bloquer.
+engine = create_async_engine(
+    DATABASE_URL,
+    pool_size=int(os.getenv("DB_POOL_SIZE", "20")),
+    max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    pool_timeout=30,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
 
-# Enregistrer le hook au niveau global
-event.listen(Session, "before_flush", update_timestamp)
+async_session = async_sessionmaker(
+    engine, expire_on_commit=False, class_=AsyncSession)
 
 
 # Fonction pour obtenir une session
-def get_session():
-    with Session(engine) as session:
+async def get_session() -> AsyncGenerator[AsyncSession, None]:
+    async with async_session() as session:
         yield session
 
 
 # Dépendance pour les endpoints FastAPI
-SessionDep = Annotated[Session, Depends(get_session)]
+SessionDep = Annotated[AsyncSession, Depends(get_session)]
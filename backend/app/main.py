@@ -1,11 +1,23 @@
+import os
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.routers import auth, users
+from app.utilities.logging_config import configure_logging
+
+configure_logging()
 
-app = FastAPI(title="Orange Plan Manager")
+app = FastAPI(title="Orange Plan Manager",
+              default_response_class=ORJSONResponse)
 
-origins = ["*"]
+# Liste explicite d'origines calculée une fois au démarrage : "*" combiné à
+# allow_credentials est invalide côté spec et forçait le wildcard à chaque
+# réponse préflight.
+origins = [origin.strip() for origin in
+           os.getenv("CORS_ORIGINS", "http://localhost:5173").split(",")
+           if origin.strip()]
 
 app.add_middleware(
     CORSMiddleware,
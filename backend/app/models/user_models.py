@@ -2,6 +2,7 @@ from datetime import datetime, timezone
 from enum import Enum
 
 from pydantic import EmailStr
+from sqlalchemy import DateTime, Index, func
 from sqlmodel import Field, SQLModel
 
 
@@ -13,22 +14,32 @@ class RoleType(str, Enum):
 
 class UserBase(SQLModel):
     username: str = Field(max_length=100, index=True, unique=True)
-    email: EmailStr = Field(max_length=100, index=True)
+    email: EmailStr = Field(max_length=100, index=True, unique=True)
     first_name: str | None = Field(max_length=100, default=None)
     last_name: str | None = Field(max_length=100, default=None)
 
 
 class User(UserBase, table=True):
     __tablename__ = "user"
+    __table_args__ = (
+        # Index couvrant : le lookup authentifié par username est servi
+        # index-only, sans toucher la table.
+        Index("ix_user_username_covering", "username",
+              postgresql_include=["hashed_password", "is_active", "role"]),
+    )
 
     id: int | None = Field(default=None, primary_key=True)
     hashed_password: str = Field(..., description="Mot de passe chiffre.")
     role: RoleType = Field(default=RoleType.USER, index=True)
     is_active: bool = Field(default=True)
     created_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now()})
     updated_at: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc))
+        default_factory=lambda: datetime.now(timezone.utc),
+        sa_type=DateTime(timezone=True),
+        sa_column_kwargs={"server_default": func.now(), "onupdate": func.now()})
 
 
 class UserCreate(UserBase):
@@ -4,22 +4,18 @@ from typing import Annotated
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from loguru import logger
-from sqlmodel import select
 
 from app.db.session import SessionDep
-from app.models.user_models import RoleType
 from app.utilities.dependencies import (ACCESS_TOKEN_EXPIRE_MINUTES,
-                                        REFRESH_TOKEN_EXPIRE_DAYS, authenticate_user, decode_token,
+                                        REFRESH_TOKEN_EXPIRE_DAYS, admin_required,
+                                        authenticate_user,
+                                        check_unique_constraint, decode_token,
                                         get_current_active_user,
-                                        validate_password, RoleChecker, get_user)
+                                        validate_password, get_user)
 from app.models.user_models import User, UserCreate, UserPublic
 from app.schemas.auth_schemas import RefreshToken, Token
 from app.utilities.encoders import hash_password, encode_token
 
-logger.remove()
-# Configure loguru to write logs to a file
-logger.add("logs/authentications.log", format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {module}:{function}:{line} - {message} | {extra}", rotation="500 MB", retention="10 days", colorize=True)
-
 router = APIRouter(
     prefix="/auth",
     tags=["Authentication"]
@@ -29,29 +25,20 @@ router = APIRouter(
 @router.post("/register", response_model=UserPublic, status_code=status.HTTP_201_CREATED)
 async def create_user(
     user: UserCreate, session: SessionDep,
-    current_user: Annotated[bool, Depends(RoleChecker(allowed_roles=[RoleType.ADMIN]))]
+    current_user: Annotated[bool, Depends(admin_required)]
 ):
     user_data = user.model_dump()
 
-    if session.exec(select(User).where(User.username == user_data["username"])).first():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="L'utilisateur existe dejas."
-        )
-
-    if session.exec(select(User).where(User.email == user_data["email"])).first():
-        raise HTTPException(
-            status_code=status.HTTP_409_CONFLICT,
-            detail="l'Email est deja utilise."
-        )
+    await check_unique_constraint(session, User, "username", user_data["username"])
+    await check_unique_constraint(session, User, "email", user_data["email"])
 
     validate_password(user_data["password"])
-    hashed_password = hash_password(user_data["password"])
+    hashed_password = await hash_password(user_data["password"])
     user_db = User(**user_data, hashed_password=hashed_password)
 
     session.add(user_db)
-    session.commit()
-    session.refresh(user_db)
+    await session.commit()
+    await session.refresh(user_db)
 
     with logger.contextualize(username=user_db.username, role=user_db.role, by=current_user.username):
         logger.info(f"User created.")
@@ -63,7 +50,7 @@ async def login_for_access_token(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     session: SessionDep
 ) -> Token:
-    user = authenticate_user(form_data.username, form_data.password, session)
+    user = await authenticate_user(form_data.username, form_data.password, session)
     sign_in_logger = logger.bind(username=form_data.username)
     if not user:
         sign_in_logger.warning(f"Login failed")
@@ -92,7 +79,7 @@ async def login_for_access_token(
 async def refresh_token(refresh: RefreshToken, session: SessionDep):
     payload = decode_token(refresh.refresh_token)
     
-    user = get_user(payload.get("sub"), session)
+    user = await get_user(payload.get("sub"), session)
     
     if not user:
         raise HTTPException(
@@ -1,30 +1,29 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlmodel import select, Session
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from pydantic import TypeAdapter
+from sqlmodel import select, update
 from loguru import logger
 
 from app.db.session import SessionDep
-from app.models.user_models import RoleType
 from app.models.user_models import User, UserPublic, UserUpdate
-from app.utilities.dependencies import RoleChecker
+from app.utilities.dependencies import (admin_required, check_unique_constraint,
+                                        invalidate_user_cache)
 from app.utilities.encoders import hash_password, verify_password
 from app.utilities.exceptions import CREDENTIALS_EXCEPTION
-from loguru import logger
-
-logger.remove()
-# Configure loguru to write logs to a file
-logger.add("logs/users.log", format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {module}:{function}:{line} - {message} | {extra}",
-           rotation="500 MB", retention="10 days", colorize=True)
 
+# Le contrôle admin est une dépendance de routeur : il s'exécute avant les
+# dépendances de chemin, donc aucun SELECT utilisateur pour un appel non
+# authentifié.
 router = APIRouter(
     prefix="/users",
-    tags=["Users"]
+    tags=["Users"],
+    dependencies=[Depends(admin_required)]
 )
 
 
-def get_user_by_id(session: Session, user_id: int) -> User:
-    user = session.get(User, user_id)
+async def get_user_by_id(session: SessionDep, user_id: int) -> User:
+    user = await session.get(User, user_id)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -33,64 +32,93 @@ def get_user_by_id(session: Session, user_id: int) -> User:
     return user
 
 
-@router.get("/", response_model=list[UserPublic], status_code=status.HTTP_200_OK)
-def list_users(
+# Dépendance de chemin : un seul SELECT par requête, mémoïsé par le cache de
+# dépendances même si plusieurs paramètres réclament le même utilisateur.
+UserByIdDep = Annotated[User, Depends(get_user_by_id)]
+
+# Adapter construit une fois au chargement : valide la page entière en un
+# appel, sans repasser par la validation response_model de FastAPI.
+USER_LIST_ADAPTER = TypeAdapter(list[UserPublic])
+
+
+@router.get("/", response_model=None, status_code=status.HTTP_200_OK)
+async def list_users(
     session: SessionDep,
-    _: Annotated[bool, Depends(RoleChecker(allowed_roles=[RoleType.ADMIN]))]
-):
-    users = session.exec(select(User)).all()
-    return users
+    offset: Annotated[int, Query(ge=0)] = 0,
+    limit: Annotated[int, Query(ge=1, le=100)] = 100
+) -> list[UserPublic]:
+    users = (await session.exec(
+        select(User).order_by(User.id).offset(offset).limit(limit))).all()
+    return USER_LIST_ADAPTER.validate_python(users, from_attributes=True)
 
 
 @router.get("/{user_id}", response_model=UserPublic, status_code=status.HTTP_200_OK)
-def get_user(
+async def get_user(
     user_id: int,
-    session: SessionDep,
-    _: Annotated[bool, Depends(RoleChecker(allowed_roles=[RoleType.ADMIN]))]
+    user: UserByIdDep
 ):
-    user = get_user_by_id(session, user_id)
     logger.info(f"Retrieved user with ID {user_id}.")
     return user
 
 
 @router.patch("/{user_id}", response_model=UserPublic, status_code=status.HTTP_200_OK)
-def update_user(
+async def update_user(
     user_id: int,
     user_update: UserUpdate,
+    user: UserByIdDep,
     session: SessionDep,
-    current_user: Annotated[bool, Depends(RoleChecker(allowed_roles=[RoleType.ADMIN]))]
+    current_user: Annotated[User, Depends(admin_required)]
 ):
-    user = get_user_by_id(session, user_id)
-    
+    old_username = user.username
+
     user_update_data = user_update.model_dump(exclude_unset=True)
 
+    if user_update_data.get("username") and user_update_data["username"] != user.username:
+        await check_unique_constraint(
+            session, User, "username", user_update_data["username"], exclude_id=user_id)
+
+    if user_update_data.get("email") and user_update_data["email"] != user.email:
+        await check_unique_constraint(
+            session, User, "email", user_update_data["email"], exclude_id=user_id)
+
     if user_update_data.get("old_password") and user_update_data.get("new_password"):
-        if verify_password(user_update_data["old_password"], user.hashed_password):
-            user_update_data["hashed_password"] = hash_password(
+        if await verify_password(user_update_data["old_password"], user.hashed_password):
+            user_update_data["hashed_password"] = await hash_password(
                 user_update_data["new_password"])
 
         else:
             raise CREDENTIALS_EXCEPTION
 
-    user.sqlmodel_update(user_update_data)
-    
-    session.add(user)
-    session.commit()
-    session.refresh(user)
+    user_update_data.pop("old_password", None)
+    user_update_data.pop("new_password", None)
+
+    if not user_update_data:
+        return user
+
+    # UPDATE ... RETURNING : une seule requête applique les changements et
+    # rapporte la ligne (updated_at compris), au lieu de UPDATE + refresh.
+    result = await session.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(**user_update_data)
+        .returning(User))
+    user = result.scalar_one()
+    await session.commit()
+    invalidate_user_cache(old_username, user.username)
     with logger.contextualize(user_modified=user.username, user_modifier=current_user.username):
         logger.info(f"Updated user with ID {user_id}.")
     return user
 
 
 @router.delete("/{user_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_user(
-    user_id: int,
+async def delete_user(
+    user: UserByIdDep,
     session: SessionDep,
-    current_user: Annotated[bool, Depends(RoleChecker(allowed_roles=[RoleType.ADMIN]))]
+    current_user: Annotated[User, Depends(admin_required)]
 ):
-    user = get_user_by_id(session, user_id)
-    session.delete(user)
-    session.commit()
-    
+    await session.delete(user)
+    await session.commit()
+    invalidate_user_cache(user.username)
+
     with logger.contextualize(user=user.username, by=current_user.username):
         logger.info('User Deleted.')
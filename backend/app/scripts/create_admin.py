@@ -1,27 +1,27 @@
 import argparse
+import asyncio
 
-from sqlalchemy import select
-from sqlmodel import Session
+from sqlmodel import select
 
-from app.db.session import engine
+from app.db.session import async_session
 from app.models.user_models import User
 
 from app.models.user_models import RoleType
 from app.utilities.encoders import hash_password
 
 
-def create_admin_user(username: str, email: str, password: str):
+async def create_admin_user(username: str, email: str, password: str):
     """Creates an admin user if one does not already exist."""
-    with Session(engine) as session:
+    async with async_session() as session:
         # Check if the admin user already exists
-        admin_user = session.exec(select(User).where(
-            User.username == username)).first()
+        admin_user = (await session.exec(select(User).where(
+            User.username == username))).first()
         if admin_user:
             print(f"Admin user '{username}' already exists.")
             return
 
         # Create the admin user
-        hashed_password = hash_password(password)
+        hashed_password = await hash_password(password)
         admin_user = User(
             username=username,
             email=email,
@@ -30,7 +30,7 @@ def create_admin_user(username: str, email: str, password: str):
             is_active=True
         )
         session.add(admin_user)
-        session.commit()
+        await session.commit()
         print(f"Admin user '{username}' created successfully.")
 
 
@@ -44,5 +44,5 @@ if __name__ == "__main__":
     args = parser.parse_args()
 
     # Call the function with the provided arguments
-    create_admin_user(username=args.username,
-                      email=args.email, password=args.password)
+    asyncio.run(create_admin_user(username=args.username,
+                                  email=args.email, password=args.password))
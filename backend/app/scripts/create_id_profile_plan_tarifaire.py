@@ -1,5 +1,9 @@
-from app.db.session import engine
-from sqlmodel import Session, select
+import asyncio
+
+from sqlalchemy import insert, tuple_
+from sqlmodel import select
+
+from app.db.session import async_session
 from app.models.id_profile_models import IDProfile
 from app.models.plan_tarifaire_id_profile_model import PlanTarifaireIDProfile
 from app.models.plan_tarifaire_models import PlanTarifaire
@@ -163,37 +167,39 @@ profile_plan_mapping = {
     ],
 }
 
-def create_id_profiles_and_plans():
-    with Session(engine) as session:
+async def create_id_profiles_and_plans():
+    async with async_session() as session:
         # First create all profiles and plans
-        profile_dict = {}
-        plan_dict = {}
-        
-        # Create ID Profiles
-        for profile_name in id_profiles:
-            profile = session.exec(select(IDProfile).where(
-                IDProfile.name == profile_name)).first()
-            if not profile:
-                profile = IDProfile(name=profile_name)
-                session.add(profile)
-                session.commit()
-                session.refresh(profile)
-                print(f"ID Profile '{profile_name}' created successfully.")
-            profile_dict[profile_name] = profile
+
+        # Create ID Profiles (one SELECT for the existing names, one batched insert)
+        existing = (await session.exec(select(IDProfile).where(
+            IDProfile.name.in_(id_profiles)))).all()
+        profile_dict = {profile.name: profile for profile in existing}
+
+        new_profiles = [IDProfile(name=name)
+                        for name in id_profiles if name not in profile_dict]
+        session.add_all(new_profiles)
+        for profile in new_profiles:
+            profile_dict[profile.name] = profile
+            print(f"ID Profile '{profile.name}' created successfully.")
 
         # Create Plan Tarifaires
-        for plan_name in plan_tarifaires:
-            plan = session.exec(select(PlanTarifaire).where(
-                PlanTarifaire.name == plan_name)).first()
-            if not plan:
-                plan = PlanTarifaire(name=plan_name)
-                session.add(plan)
-                session.commit()
-                session.refresh(plan)
-                print(f"Plan Tarifaire '{plan_name}' created successfully.")
-            plan_dict[plan_name] = plan
+        existing = (await session.exec(select(PlanTarifaire).where(
+            PlanTarifaire.name.in_(plan_tarifaires)))).all()
+        plan_dict = {plan.name: plan for plan in existing}
+
+        new_plans = [PlanTarifaire(name=name)
+                     for name in plan_tarifaires if name not in plan_dict]
+        session.add_all(new_plans)
+        for plan in new_plans:
+            plan_dict[plan.name] = plan
+            print(f"Plan Tarifaire '{plan.name}' created successfully.")
+
+        # Assign the primary keys without committing yet
+        await session.flush()
 
         # Create relationships
+        candidates = []
         for profile_name, plan_names in profile_plan_mapping.items():
             profile = profile_dict.get(profile_name)
             if not profile:
@@ -206,21 +212,34 @@ def create_id_profiles_and_plans():
                     print(f"Warning: Plan {plan_name} not found")
                     continue
 
-                stmt = select(PlanTarifaireIDProfile).where(
-                    PlanTarifaireIDProfile.id_profile_id == profile.id,
-                    PlanTarifaireIDProfile.plan_tarifaire_id == plan.id
-                )
-                existing_relation = session.exec(stmt).first()
+                candidates.append((profile, plan))
+
+        # Une seule requête pour toutes les paires déjà en base
+        pairs = [(profile.id, plan.id) for profile, plan in candidates]
+        existing_relations = set((await session.exec(
+            select(PlanTarifaireIDProfile.id_profile_id,
+                   PlanTarifaireIDProfile.plan_tarifaire_id)
+            .where(tuple_(PlanTarifaireIDProfile.id_profile_id,
+                          PlanTarifaireIDProfile.plan_tarifaire_id)
+                   .in_(pairs)))).all())
+
+        # Insertion directe dans la table de liaison : pas de chargement
+        # (ni de lazy load, impossible en async) des collections `plans`
+        missing = []
+        for profile, plan in candidates:
+            if (profile.id, plan.id) not in existing_relations:
+                missing.append({"id_profile_id": profile.id,
+                                "plan_tarifaire_id": plan.id})
+                print(f"Added relationship: {profile.name} -> {plan.name}")
+            else:
+                print(f"Relationship between {profile.name} and {plan.name} already exists.")
 
-                if not existing_relation:
-                    profile.plans.append(plan)  # Ajout direct
-                    print(f"Added relationship: {profile_name} -> {plan_name}")
-                else:
-                    print(f"Relationship between {profile_name} and {plan_name} already exists.")
+        if missing:
+            await session.execute(insert(PlanTarifaireIDProfile), missing)
 
-        session.commit()
+        await session.commit()
         print("All relationships created successfully.")
 
 # Run the function
 if __name__ == "__main__":
-    create_id_profiles_and_plans()
+    asyncio.run(create_id_profiles_and_plans())
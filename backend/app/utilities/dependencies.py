@@ -1,35 +1,89 @@
 import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Annotated, Type, Any
 
-from dotenv import load_dotenv
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from loguru import logger
-from sqlmodel import SQLModel, select, Session
+from sqlmodel import SQLModel, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.db.session import SessionDep
-from app.models.user_models import User
-from app.schemas.auth_schemas import TokenData
+from app.models.user_models import RoleType, User
 from app.utilities.encoders import verify_password, decode_token
 from app.utilities.exceptions import CREDENTIALS_EXCEPTION
 
-# Load environment variables
-load_dotenv()
-
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
-# OAuth2 scheme for token authentication
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
+# Bearer scheme for token authentication : HTTPBearer découpe le header
+# Authorization sans le parsing OAuth2 complet d'OAuth2PasswordBearer.
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def get_bearer_token(
+    credentials: Annotated[HTTPAuthorizationCredentials | None,
+                           Depends(bearer_scheme)],
+) -> str:
+    """Extract the raw bearer token, rejecting missing credentials with 401."""
+    if credentials is None:
+        raise CREDENTIALS_EXCEPTION
+    return credentials.credentials
+
+
+# Dépendance partagée : le header Authorization n'est extrait qu'une fois par
+# requête grâce au cache de dépendances.
+TokenDep = Annotated[str, Depends(get_bearer_token)]
+
+# Patterns compilés une fois au chargement du module pour validate_password
+UPPERCASE_PATTERN = re.compile(r'[A-Z]')
+LOWERCASE_PATTERN = re.compile(r'[a-z]')
+DIGIT_PATTERN = re.compile(r'[0-9]')
+SPECIAL_CHAR_PATTERN = re.compile(r'[@$!%*?&#]')
+
+
+@dataclass(frozen=True)
+class UserSnapshot:
+    """Detached copy of a user row, safe to cache across sessions."""
+
+    id: int
+    username: str
+    email: str
+    first_name: str | None
+    last_name: str | None
+    role: str
+    is_active: bool
+    hashed_password: str
+    created_at: datetime
+    updated_at: datetime
+
 
+# Cache court (username -> UserSnapshot) qui absorbe le SELECT par requête
+# du chemin authentifié ; invalidé par les endpoints qui modifient un user.
+user_cache: TTLCache = TTLCache(maxsize=5000, ttl=10)
+_user_cache_lock = threading.Lock()
 
-def get_user(username: str, session: Session) -> User:
+
+def invalidate_user_cache(*usernames: str) -> None:
+    """Drop cached snapshots after a user row is modified or deleted."""
+    with _user_cache_lock:
+        for username in usernames:
+            user_cache.pop(username, None)
+
+
+async def get_user(username: str, session: AsyncSession) -> User:
     """
     Retrieve a user by their username.
 
+    Recently seen users are served from a short-TTL cache as a
+    `UserSnapshot` (same attributes as `User`, never session-bound).
+
     Args:
         username (str): The username of the user to retrieve.
-        session (Session): The database session.
+        session (AsyncSession): The database session.
 
     Returns:
         User: The retrieved user.
@@ -37,7 +91,14 @@ def get_user(username: str, session: Session) -> User:
     Raises:
         HTTPException: If the user is not found.
     """
-    user = session.exec(select(User).where(User.username == username)).first()
+    with _user_cache_lock:
+        cached = user_cache.get(username)
+
+    if cached is not None:
+        return cached
+
+    result = await session.exec(select(User).where(User.username == username))
+    user = result.first()
 
     if not user:
         logger.warning(f"User not found: {username}")
@@ -46,15 +107,29 @@ def get_user(username: str, session: Session) -> User:
             detail="User not found",
         )
 
+    with _user_cache_lock:
+        user_cache[username] = UserSnapshot(
+            id=user.id,
+            username=user.username,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            role=user.role,
+            is_active=user.is_active,
+            hashed_password=user.hashed_password,
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+
     return user
 
 
-def get_user_by_email(session: Session, email: str) -> User:
+async def get_user_by_email(session: AsyncSession, email: str) -> User:
     """
     Retrieve a user by their email.
 
     Args:
-        session (Session): The database session.
+        session (AsyncSession): The database session.
         email (str): The email of the user to retrieve.
 
     Returns:
@@ -63,7 +138,8 @@ def get_user_by_email(session: Session, email: str) -> User:
     Raises:
         HTTPException: If the user is not found.
     """
-    user = session.exec(select(User).where(User.email == email)).first()
+    result = await session.exec(select(User).where(User.email == email))
+    user = result.first()
 
     if not user:
         logger.warning(f"User not found with email: {email}")
@@ -75,14 +151,14 @@ def get_user_by_email(session: Session, email: str) -> User:
     return user
 
 
-def authenticate_user(username: str, password: str, session: Session) -> User:
+async def authenticate_user(username: str, password: str, session: AsyncSession) -> User:
     """
     Authenticate a user by username and password.
 
     Args:
         username (str): The username of the user.
         password (str): The password to verify.
-        session (Session): The database session.
+        session (AsyncSession): The database session.
 
     Returns:
         User: The authenticated user.
@@ -90,7 +166,7 @@ def authenticate_user(username: str, password: str, session: Session) -> User:
     Raises:
         HTTPException: If the user is inactive or credentials are invalid.
     """
-    user = get_user(username=username, session=session)
+    user = await get_user(username=username, session=session)
 
     if not user.is_active:
         logger.warning(f"Inactive user login attempt: {username}")
@@ -99,7 +175,7 @@ def authenticate_user(username: str, password: str, session: Session) -> User:
             detail="Inactive user.",
         )
 
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password(password, user.hashed_password):
         logger.warning(f"Invalid password attempt for user: {username}")
         raise CREDENTIALS_EXCEPTION
 
@@ -107,8 +183,8 @@ def authenticate_user(username: str, password: str, session: Session) -> User:
     return user
 
 
-def get_current_user(
-    token: Annotated[str, Depends(oauth2_scheme)],
+async def get_current_user(
+    token: TokenDep,
     session: SessionDep,
 ) -> User:
     """
@@ -116,7 +192,7 @@ def get_current_user(
 
     Args:
         token (str): The OAuth2 token.
-        session (Session): The database session.
+        session (AsyncSession): The database session.
 
     Returns:
         User: The authenticated user.
@@ -131,8 +207,7 @@ def get_current_user(
         logger.warning("Invalid token: Missing username")
         raise CREDENTIALS_EXCEPTION
 
-    token_data = TokenData(username=username)
-    user = get_user(username=token_data.username, session=session)
+    user = await get_user(username=username, session=session)
 
     return user
 
@@ -175,14 +250,14 @@ def validate_password(password: str) -> None:
     """
     validation_rules = [
         (lambda p: len(p) >= 6, "Password must be at least 6 characters long."),
-        (lambda p: re.search(
-            r'[A-Z]', p), "Password must contain at least one uppercase letter."),
-        (lambda p: re.search(
-            r'[a-z]', p), "Password must contain at least one lowercase letter."),
-        (lambda p: re.search(r'[0-9]', p),
+        (lambda p: UPPERCASE_PATTERN.search(p),
+         "Password must contain at least one uppercase letter."),
+        (lambda p: LOWERCASE_PATTERN.search(p),
+         "Password must contain at least one lowercase letter."),
+        (lambda p: DIGIT_PATTERN.search(p),
          "Password must contain at least one number."),
-        (lambda p: re.search(
-            r'[@$!%*?&#]', p), "Password must contain at least one special character."),
+        (lambda p: SPECIAL_CHAR_PATTERN.search(p),
+         "Password must contain at least one special character."),
     ]
 
     for rule, error_message in validation_rules:
@@ -194,8 +269,8 @@ def validate_password(password: str) -> None:
             )
 
 
-def check_unique_constraint(
-    session: Session,
+async def check_unique_constraint(
+    session: AsyncSession,
     model: Type[SQLModel],
     field: str,
     value: Any,
@@ -205,7 +280,7 @@ def check_unique_constraint(
     Check if a value is unique for a given field in a model.
 
     Args:
-        session (Session): The database session.
+        session (AsyncSession): The database session.
         model (Type[SQLModel]): The SQLModel class to check.
         field (str): The field to check for uniqueness.
         value (Any): The value to check.
@@ -218,7 +293,7 @@ def check_unique_constraint(
     if exclude_id is not None:
         query = query.where(model.id != exclude_id)
 
-    if session.exec(query.exists()).scalar():
+    if await session.scalar(select(query.exists())):
         logger.warning(f"Unique constraint violation: {
                        model.__name__}.{field} = {value}")
         raise HTTPException(
@@ -259,3 +334,8 @@ class RoleChecker:
             status_code=status.HTTP_403_FORBIDDEN,
             detail="You don't have enough permissions",
         )
+
+
+# Instance partagée : le même callable pour toutes les routes admin, donc
+# une seule entrée dans le cache de dépendances FastAPI par requête.
+admin_required = RoleChecker(allowed_roles=[RoleType.ADMIN])
@@ -1,7 +1,11 @@
+import hashlib
+import threading
 from datetime import timedelta, datetime, timezone
 from os import environ
 
 import jwt
+from cachetools import TTLCache
+from fastapi.concurrency import run_in_threadpool
 from dotenv import load_dotenv
 from jwt import ExpiredSignatureError, InvalidTokenError
 
@@ -12,33 +16,76 @@ from app.utilities.exceptions import TOKEN_EXPIRE_EXCEPTION, CREDENTIALS_EXCEPTI
 load_dotenv()
 
 SECRET_KEY = environ["SECRET_KEY"]
-ALGORITHM = "HS256"
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# HS256 par défaut (HMAC natif via hashlib) ; JWT_ALGORITHM="EdDSA" bascule
+# sur Ed25519 avec une paire de clés PEM, la vérification ne dépendant alors
+# plus du secret partagé.
+ALGORITHM = environ.get("JWT_ALGORITHM", "HS256")
 
+if ALGORITHM == "EdDSA":
+    SIGNING_KEY = environ["JWT_PRIVATE_KEY"]
+    VERIFYING_KEY = environ["JWT_PUBLIC_KEY"]
+else:
+    SIGNING_KEY = VERIFYING_KEY = SECRET_KEY
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+# Cache opt-in des payloads déjà vérifiés (JWT_CACHE_TTL=0 pour désactiver) :
+# évite de refaire HMAC + parse JSON sur le même bearer token à chaque requête.
+JWT_CACHE_TTL = int(environ.get("JWT_CACHE_TTL", "5"))
 
+_token_cache: TTLCache | None = (
+    TTLCache(maxsize=10000, ttl=JWT_CACHE_TTL) if JWT_CACHE_TTL > 0 else None
+)
+_token_cache_lock = threading.Lock()
 
-def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+# Facteur de travail bcrypt fixé une fois pour toutes : passlib n'a plus à
+# relire la config par hash, et la latence de login se règle par environnement.
+BCRYPT_ROUNDS = int(environ.get("BCRYPT_ROUNDS", "12"))
+
+pwd_context = CryptContext(
+    schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=BCRYPT_ROUNDS)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    # bcrypt prend ~100-300 ms : exécuté dans le threadpool pour ne pas
+    # bloquer l'event loop pendant chaque login.
+    return await run_in_threadpool(
+        pwd_context.verify, plain_password, hashed_password)
+
+
+async def hash_password(password: str) -> str:
+    return await run_in_threadpool(pwd_context.hash, password)
 
 
 def encode_token(data: dict, expires_delta: timedelta) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + expires_delta
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, SIGNING_KEY, algorithm=ALGORITHM)
 
 
 def decode_token(token: str) -> dict:
+    if _token_cache is not None:
+        key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+
+        with _token_cache_lock:
+            payload = _token_cache.get(key)
+
+        if payload is not None:
+            if payload["exp"] > datetime.now(timezone.utc).timestamp():
+                return payload
+            raise TOKEN_EXPIRE_EXCEPTION
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
+        payload = jwt.decode(token, VERIFYING_KEY, algorithms=[ALGORITHM])
 
     except ExpiredSignatureError:
         raise TOKEN_EXPIRE_EXCEPTION
 
     except InvalidTokenError:
         raise CREDENTIALS_EXCEPTION
+
+    if _token_cache is not None:
+        with _token_cache_lock:
+            _token_cache[key] = payload
+
+    return payload
@@ -0,0 +1,36 @@
+from loguru import logger
+
+LOG_FORMAT = ("{time:YYYY-MM-DD HH:mm:ss} | {level} | "
+              "{module}:{function}:{line} - {message} | {extra}")
+
+# Modules dont les logs partent dans authentications.log
+AUTH_MODULES = ("app.routers.auth", "app.utilities")
+
+
+def configure_logging() -> None:
+    """
+    Configure the loguru sinks once, at application startup.
+
+    Each router previously called `logger.remove()` at import time, so the
+    last-imported module silently discarded the sinks of the others. The
+    sinks are declared here with per-module filters instead.
+    """
+    logger.remove()
+    logger.add(
+        "logs/authentications.log",
+        format=LOG_FORMAT,
+        rotation="500 MB",
+        retention="10 days",
+        colorize=False,
+        enqueue=True,
+        filter=lambda record: record["name"].startswith(AUTH_MODULES),
+    )
+    logger.add(
+        "logs/users.log",
+        format=LOG_FORMAT,
+        rotation="500 MB",
+        retention="10 days",
+        colorize=False,
+        enqueue=True,
+        filter=lambda record: record["name"].startswith("app.routers.users"),
+    )
@@ -1,10 +1,11 @@
 from fastapi import HTTPException
-from sqlmodel import Session, SQLModel
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 
-def get_item_or_404(session: Session, model: SQLModel, item_id: int):
+async def get_item_or_404(session: AsyncSession, model: SQLModel, item_id: int):
     """Generic function to get an item by ID or raise 404"""
-    item = session.get(model, item_id)
+    item = await session.get(model, item_id)
     if not item:
         raise HTTPException(
             status_code=404,